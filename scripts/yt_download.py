@@ -9,31 +9,37 @@ Supports two modes:
 """
 
 import argparse
+import bisect
+import functools
+import glob
 import json
 import os
-import random
 import shutil
 import subprocess
 import sys
-import time
-import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 
+import numpy as np
 import yt_dlp
 
 VAAPI_DEVICE = "/dev/dri/renderD128"
 
 
-def has_vaapi() -> bool:
-    if not os.path.exists(VAAPI_DEVICE):
+@functools.lru_cache(maxsize=None)
+def has_vaapi(device: str = VAAPI_DEVICE) -> bool:
+    """Probe a device once per run — the result can't change between clips,
+    and the probe itself costs an ffmpeg spawn plus a VAAPI device init."""
+    if not os.path.exists(device):
         return False
     try:
         r = subprocess.run(
-            ["ffmpeg", "-hide_banner", "-init_hw_device", f"vaapi=va:{VAAPI_DEVICE}",
+            ["ffmpeg", "-hide_banner", "-init_hw_device", f"vaapi=va:{device}",
              "-f", "lavfi", "-i", "nullsrc=s=64x64:d=0.1",
              "-vf", "format=nv12,hwupload", "-c:v", "h264_vaapi", "-frames:v", "1",
              "-f", "null", "-"],
-            capture_output=True, timeout=10,
+            capture_output=True, timeout=10, bufsize=1 << 20,
         )
         return r.returncode == 0
     except Exception:
@@ -41,36 +47,197 @@ def has_vaapi() -> bool:
 
 
 def get_duration(video_path: str) -> float:
+    """Read duration from container metadata only — no frame decoding.
+    DASH-sourced webm sometimes carries duration on the stream instead of
+    the format, so ask for both and take the max."""
     r = subprocess.run(
-        ["ffprobe", "-v", "error", "-show_entries", "format=duration",
-         "-of", "default=noprint_wrappers=1:nokey=1", video_path],
-        capture_output=True, text=True,
+        ["ffprobe", "-v", "error", "-select_streams", "v:0",
+         "-show_entries", "format=duration:stream=duration",
+         "-of", "json", video_path],
+        capture_output=True, text=True, bufsize=1 << 20,
     )
-    return float(r.stdout.strip())
+    try:
+        data = json.loads(r.stdout)
+    except json.JSONDecodeError:
+        data = {}
+    candidates = [data.get("format", {}).get("duration")]
+    candidates += [s.get("duration") for s in data.get("streams", [])]
+    durations = []
+    for value in candidates:
+        try:
+            durations.append(float(value))
+        except (TypeError, ValueError):
+            continue
+    if not durations:
+        raise ValueError(f"ffprobe reported no duration for {video_path}")
+    return max(durations)
+
+
+def probe_video(video_path: str) -> dict:
+    """Probe the video stream once (pix_fmt, width, height). Callers cache
+    the result and pass it down instead of re-probing per clip."""
+    r = subprocess.run(
+        ["ffprobe", "-v", "error", "-select_streams", "v:0",
+         "-show_entries", "stream=pix_fmt,width,height", "-of", "json", video_path],
+        capture_output=True, text=True, bufsize=1 << 20,
+    )
+    try:
+        streams = json.loads(r.stdout).get("streams", [])
+        return streams[0] if streams else {}
+    except (json.JSONDecodeError, IndexError):
+        return {}
+
+
+def list_keyframes(video_path: str) -> list[float]:
+    """Return sorted keyframe timestamps (seconds). One ffprobe pass that
+    skips non-key frames, so only packet headers are read. Empty list on
+    failure, which callers treat as 'no stream copy possible'."""
+    r = subprocess.run(
+        ["ffprobe", "-v", "error", "-select_streams", "v:0",
+         "-skip_frame", "nokey", "-show_entries", "frame=pts_time",
+         "-of", "csv=p=0", video_path],
+        capture_output=True, text=True, bufsize=1 << 20,
+    )
+    if r.returncode != 0:
+        return []
+    keyframes = []
+    for line in r.stdout.splitlines():
+        value = line.strip().rstrip(",")
+        if not value or value == "N/A":
+            continue
+        try:
+            keyframes.append(float(value))
+        except ValueError:
+            continue
+    return sorted(keyframes)
+
 
+def snap_to_keyframe(start: float, keyframes: list[float]) -> float | None:
+    """Nearest keyframe <= start, or None if there is none."""
+    i = bisect.bisect_right(keyframes, start)
+    return keyframes[i - 1] if i else None
 
-def _vaapi_cmd(input_path: str, start: float, duration: int, output_path: str) -> list[str]:
+
+def _copy_cmd(input_path: str, start: float, duration: int, output_path: str) -> list[str]:
     return [
         "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
-        "-init_hw_device", f"vaapi=va:{VAAPI_DEVICE}",
+        "-ss", f"{start:.3f}",
+        "-i", input_path,
+        "-t", str(duration),
+        "-an",
+        "-c:v", "copy",
+        "-movflags", "frag_keyframe+empty_moov+default_base_moof",
+        output_path,
+    ]
+
+
+def _vaapi_filter(probe: dict | None) -> list[str]:
+    """Pick the -vf args for the VAAPI path. 8-bit 4:2:0 sources decode
+    straight into NV12 surfaces, so the decode->encode path can stay
+    surface-to-surface with no filter at all; anything else (e.g. 10-bit
+    VP9) needs one scale_vaapi pass to convert format on the GPU."""
+    if probe and probe.get("pix_fmt") in ("yuv420p", "nv12"):
+        return []
+    return ["-vf", "scale_vaapi=format=nv12"]
+
+
+@functools.lru_cache(maxsize=1)
+def _vaapi_encoder_opts() -> tuple[str, ...]:
+    """Rate-control args for h264_vaapi, probed once via vainfo. When the
+    H264 low-power entrypoint (VDENC fixed-function silicon) is exposed,
+    use it with 2 B-frames — modern Intel Gen handles both and it encodes
+    noticeably faster. Otherwise stay on the full-feature encoder with
+    B-frames off, which is safe across older drivers."""
+    low_power = False
+    try:
+        r = subprocess.run(
+            ["vainfo"], capture_output=True, text=True, timeout=10, bufsize=1 << 20,
+        )
+        if r.returncode == 0:
+            for line in r.stdout.splitlines():
+                if "H264" in line and "VAEntrypointEncSliceLP" in line:
+                    low_power = True
+                    break
+    except Exception:
+        pass
+    if low_power:
+        return ("-rc_mode", "CQP", "-qp", "20", "-low_power", "1", "-bf", "2")
+    return ("-rc_mode", "CQP", "-qp", "18", "-bf", "0")
+
+
+def make_cut_cmd(
+    probe: dict | None = None, device: str = VAAPI_DEVICE,
+) -> Callable[..., list[str]]:
+    """Specialize the VAAPI argv to the probed stream and device once.
+    The constant head (device init) and tail (filter, encoder opts, mux
+    flags) are frozen as tuples; the returned callable only fills in the
+    per-clip seek, duration and output path."""
+    head = (
+        "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+        "-init_hw_device", f"vaapi=va:{device}",
         "-hwaccel", "vaapi",
         "-hwaccel_output_format", "vaapi",
-        "-hwaccel_device", VAAPI_DEVICE,
         "-extra_hw_frames", "64",
-        "-ss", f"{start:.3f}", "-t", str(duration),
-        "-i", input_path,
+    )
+    tail = (
         "-an",
-        "-vf", "scale_vaapi=format=nv12",
+        *_vaapi_filter(probe),
         "-c:v", "h264_vaapi",
-        "-qp", "18",
-        "-bf", "0",
+        *_vaapi_encoder_opts(),
         "-async_depth", "64",
         "-compression_level", "0",
         "-profile:v", "high",
         "-level", "4.2",
-        "-movflags", "+faststart",
-        output_path,
+        "-movflags", "frag_keyframe+empty_moov+default_base_moof",
+    )
+
+    def cmd(
+        input_path: str, start: float, duration: int, output_path: str,
+        accurate_seek: bool = True,
+    ) -> list[str]:
+        return [
+            *head,
+            *([] if accurate_seek else ["-noaccurate_seek"]),
+            "-ss", f"{start:.3f}", "-t", str(duration),
+            "-i", input_path,
+            *tail,
+            output_path,
+        ]
+
+    return cmd
+
+
+def _vaapi_multi_cmd(
+    input_path: str, starts: list[float], duration: int, output_paths: list[str],
+    probe: dict | None = None,
+) -> list[str]:
+    """One ffmpeg invocation that decodes the input once and fans out to all
+    outputs, instead of N processes each re-initializing VAAPI and re-seeking.
+    The named device from -init_hw_device is picked up by -hwaccel, so the
+    DRM node is opened exactly once for the whole batch."""
+    cmd = [
+        "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+        "-init_hw_device", f"vaapi=va:{VAAPI_DEVICE}",
+        "-hwaccel", "vaapi",
+        "-hwaccel_output_format", "vaapi",
+        "-extra_hw_frames", "64",
+        "-i", input_path,
     ]
+    for start, output_path in zip(starts, output_paths):
+        cmd += [
+            "-ss", f"{start:.3f}", "-t", str(duration),
+            "-an",
+            *_vaapi_filter(probe),
+            "-c:v", "h264_vaapi",
+            *_vaapi_encoder_opts(),
+            "-async_depth", "64",
+            "-compression_level", "0",
+            "-profile:v", "high",
+            "-level", "4.2",
+            "-movflags", "frag_keyframe+empty_moov+default_base_moof",
+            output_path,
+        ]
+    return cmd
 
 
 def _software_cmd(input_path: str, start: float, duration: int, output_path: str) -> list[str]:
@@ -85,22 +252,53 @@ def _software_cmd(input_path: str, start: float, duration: int, output_path: str
         "-profile:v", "high",
         "-level", "4.2",
         "-pix_fmt", "yuv420p",
-        "-movflags", "+faststart",
+        "-movflags", "frag_keyframe+empty_moov+default_base_moof",
         output_path,
     ]
 
 
+def _render_nodes() -> list[str]:
+    """DRM render nodes that pass the VAAPI encode probe, for spreading
+    workers across GPUs. Hybrid-graphics hosts expose nodes with no usable
+    encoder (e.g. a discrete card next to the iGPU); pinning clips to one
+    of those would just burn a doomed ffmpeg attempt per clip."""
+    nodes = [n for n in sorted(glob.glob("/dev/dri/renderD*")) if has_vaapi(n)]
+    return nodes or [VAAPI_DEVICE]
+
+
 def cut_with_ffmpeg(
     input_path: str, start: float, duration: int,
-    output_path: str,
+    output_path: str, probe: dict | None = None,
+    keyframe_aligned: bool = False, device: str = VAAPI_DEVICE,
+    vaapi_cmd: Callable[..., list[str]] | None = None,
 ) -> str:
-    """Cut a segment. Try VAAPI (GPU) first, fall back to libx264 (CPU)."""
-    use_vaapi = has_vaapi()
+    """Cut a segment. When the start is snapped to a keyframe, stream copy
+    (no decode/encode at all); otherwise try VAAPI (GPU) first, fall back
+    to libx264 (CPU). Keyframe-aligned starts that end up re-encoded skip
+    the accurate-seek pre-roll — there are no frames to decode between the
+    keyframe and the requested start."""
+    if keyframe_aligned:
+        cmd = _copy_cmd(input_path, start, duration, output_path)
+        try:
+            subprocess.run(cmd, check=True, capture_output=True, bufsize=1 << 20)
+            return "copy"
+        except subprocess.CalledProcessError:
+            sys.stderr.write("[encode] stream copy failed, falling back to re-encode\n")
+            sys.stderr.flush()
+            if os.path.exists(output_path):
+                os.remove(output_path)
+
+    use_vaapi = has_vaapi(device)
 
     if use_vaapi:
-        cmd = _vaapi_cmd(input_path, start, duration, output_path)
+        if vaapi_cmd is None:
+            vaapi_cmd = make_cut_cmd(probe, device)
+        cmd = vaapi_cmd(
+            input_path, start, duration, output_path,
+            accurate_seek=not keyframe_aligned,
+        )
         try:
-            subprocess.run(cmd, check=True, capture_output=True)
+            subprocess.run(cmd, check=True, capture_output=True, bufsize=1 << 20)
             return "vaapi"
         except subprocess.CalledProcessError:
             sys.stderr.write("[encode] VAAPI failed, falling back to libx264 (CPU)\n")
@@ -130,10 +328,27 @@ def extract_youtube_id(url: str) -> str | None:
     return v[0] if v else None
 
 
+def _cleanup_partial_download(out_dir: str, youtube_id: str | None) -> None:
+    """Remove .part/.ytdl leftovers for this video from out_dir. Since
+    downloads land in the permanent _sources dir and the outtmpl embeds a
+    timestamp, a failed attempt would otherwise leave a multi-GB orphan
+    that no retry ever resumes."""
+    if not youtube_id:
+        return
+    for path in glob.glob(os.path.join(out_dir, f"{youtube_id}_*")):
+        if path.endswith((".part", ".ytdl")):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
 def download_video(url: str, out_dir: str) -> dict:
-    """Download a YouTube video. Returns dict with path, title, youtube_id."""
+    """Download a YouTube video straight into out_dir (the permanent
+    _sources location — no temp-dir round trip). Returns dict with path,
+    title, youtube_id."""
     url = clean_url(url)
-    outtmpl = os.path.join(out_dir, "source.%(ext)s")
+    outtmpl = os.path.join(out_dir, "%(id)s_%(epoch)s.%(ext)s")
     ydl_opts = {
         "format": "bestvideo[height<=1440]/best[height<=1440]",
         "format_sort": ["res:1440", "vbr", "fps"],
@@ -141,38 +356,67 @@ def download_video(url: str, out_dir: str) -> dict:
         "noplaylist": True,
         "max_filesize": 5 * 1024 * 1024 * 1024,
         "concurrent_fragment_downloads": 8,
-        "buffersize": 256 * 1024,
+        "buffersize": 1024 * 1024,
         "retries": 15,
         "fragment_retries": 15,
         "file_access_retries": 5,
         "extractor_retries": 5,
+        # android/ios player clients are not subject to the web client's
+        # nsig rate cipher, which can cap streams to ~130 KB/s.
+        "extractor_args": {"youtube": {"player_client": ["android", "ios", "web"]}},
+        "http_chunk_size": 10 * 1024 * 1024,
     }
+    if shutil.which("aria2c"):
+        # 16 ranged connections per fragment URL sidesteps per-stream
+        # throttling; concurrent_fragment_downloads still schedules fragments.
+        ydl_opts["external_downloader"] = {"default": "aria2c"}
+        ydl_opts["external_downloader_args"] = {
+            "aria2c": ["-x", "16", "-s", "16", "-k", "1M", "--file-allocation=none"],
+        }
 
-    title = None
-    youtube_id = None
-
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        info = ydl.extract_info(url, download=False)
-        title = info.get("title")
-        youtube_id = info.get("id")
-        fmt = info.get("format", "unknown")
-        height = info.get("height", "?")
-        vbr = info.get("vbr", "?")
-        fsize = info.get("filesize") or info.get("filesize_approx") or 0
-        sys.stderr.write(
-            f"[yt-dlp] Selected: {fmt} | {height}p | vbr={vbr} | ~{fsize/(1024*1024):.0f}MB\n"
-        )
-        sys.stderr.flush()
-        ydl.download([url])
+    try:
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            # One extract_info(download=True) call: player JS fetch, signature
+            # and nsig solving happen once instead of probe + download.
+            info = ydl.extract_info(url, download=True)
+            title = info.get("title")
+            youtube_id = info.get("id")
+            duration = info.get("duration")
+            fmt = info.get("format", "unknown")
+            height = info.get("height", "?")
+            vbr = info.get("vbr", "?")
+            fsize = info.get("filesize") or info.get("filesize_approx") or 0
+            sys.stderr.write(
+                f"[yt-dlp] Selected: {fmt} | {height}p | vbr={vbr} | ~{fsize/(1024*1024):.0f}MB\n"
+            )
+            sys.stderr.flush()
 
-    VIDEO_EXTS = (".mp4", ".mkv", ".webm", ".avi", ".mov")
-    for f in os.listdir(out_dir):
-        if f.lower().endswith(VIDEO_EXTS):
-            return {
-                "path": os.path.join(out_dir, f),
-                "title": title,
-                "youtube_id": youtube_id,
-            }
+            # yt-dlp knows the exact file it wrote — no need to scan out_dir
+            # (which also holds earlier sources and could leave .part races).
+            requested = info.get("requested_downloads") or []
+            path = requested[0].get("filepath") if requested else None
+    except Exception:
+        _cleanup_partial_download(out_dir, extract_youtube_id(url))
+        raise
+
+    if not path and youtube_id:
+        # prepare_filename is no fallback here: it re-evaluates %(epoch)s
+        # and names a file that was never written. Glob for this video's
+        # id instead and take the newest completed file.
+        matches = [
+            p for p in glob.glob(os.path.join(out_dir, f"{youtube_id}_*"))
+            if not p.endswith((".part", ".ytdl"))
+        ]
+        if matches:
+            path = max(matches, key=os.path.getmtime)
+
+    if path and os.path.exists(path):
+        return {
+            "path": path,
+            "title": title,
+            "youtube_id": youtube_id,
+            "duration": duration,
+        }
 
     try:
         contents = os.listdir(out_dir)
@@ -184,18 +428,51 @@ def download_video(url: str, out_dir: str) -> dict:
     )
 
 
+def _cut_clips_parallel(
+    video_path: str,
+    starts: list[float],
+    duration: int,
+    filepaths: list[str],
+    probe: dict | None,
+    aligned: list[bool],
+) -> str:
+    """Cut clips across a small worker pool. Intel iGPUs expose multiple
+    media-engine contexts, so two concurrent VAAPI encodes roughly double
+    throughput; on multi-GPU hosts clips are pinned round-robin to each
+    render node."""
+    workers = max(1, int(os.environ.get("VAAPI_WORKERS", "2")))
+    nodes = _render_nodes()
+    # One specialized argv builder per device, shared by all that
+    # device's clips.
+    cmds = {node: make_cut_cmd(probe, node) for node in nodes}
+
+    def cut_one(i: int) -> str:
+        node = nodes[i % len(nodes)]
+        return cut_with_ffmpeg(
+            video_path, starts[i], duration, filepaths[i], probe,
+            keyframe_aligned=aligned[i], device=node, vaapi_cmd=cmds[node],
+        )
+
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        results = list(ex.map(cut_one, range(len(starts))))
+    return results[-1] if results else "unknown"
+
+
 def cut_segments(
     video_path: str,
     category: str,
     duration: int,
     num_clips: int,
     videos_dir: str,
+    total_duration: float | None = None,
 ) -> list[dict]:
     """
     Trim first/last 10s, then cut random segments.
-    Returns list of dicts with clip metadata.
+    Returns list of dicts with clip metadata. total_duration, if known
+    (e.g. from yt-dlp's info dict), avoids an ffprobe spawn.
     """
-    total_duration = get_duration(video_path)
+    if total_duration is None:
+        total_duration = get_duration(video_path)
 
     trim_start = 10.0
     trim_end = max(total_duration - 10.0, trim_start + duration)
@@ -216,23 +493,68 @@ def cut_segments(
     max_possible = int(usable_duration / duration)
     actual_clips = min(num_clips, max_possible)
 
-    all_possible_starts = []
-    t = trim_start
-    while t + duration <= trim_end:
-        all_possible_starts.append(t)
-        t += 1.0
-
+    # 1s grid of candidate starts, sampled without replacement in one
+    # vectorized call instead of a Python loop + random.sample.
+    all_possible_starts = np.arange(
+        trim_start, trim_end - duration + 1e-9, 1.0, dtype=np.float64,
+    )
     if len(all_possible_starts) < actual_clips:
         actual_clips = len(all_possible_starts)
 
-    chosen_starts = sorted(random.sample(all_possible_starts, actual_clips))
+    chosen_starts = np.sort(
+        np.random.choice(all_possible_starts, size=actual_clips, replace=False)
+    ).tolist()
+
+    filenames = [f"bg_{start_index + i:03d}.mp4" for i in range(len(chosen_starts))]
+    filepaths = [os.path.join(output_dir, f) for f in filenames]
+
+    probe = probe_video(video_path)
+    keyframes = list_keyframes(video_path)
+
+    # Snap starts back to the nearest keyframe so clips can be stream-copied
+    # (no decode/encode). Starts with no keyframe in the usable range, or
+    # whose keyframe is already claimed by an earlier start (two sampled
+    # starts can share a keyframe interval), keep their exact position and
+    # go through the re-encode path so no two clips come out identical.
+    aligned = [False] * len(chosen_starts)
+    if keyframes:
+        taken = set()
+        for i, start_time in enumerate(chosen_starts):
+            kf = snap_to_keyframe(start_time, keyframes)
+            if kf is not None and kf >= trim_start and kf not in taken:
+                chosen_starts[i] = kf
+                aligned[i] = True
+                taken.add(kf)
 
     encoder_used = "unknown"
+    if any(aligned):
+        encoder_used = _cut_clips_parallel(
+            video_path, chosen_starts, duration, filepaths, probe, aligned,
+        )
+    else:
+        if len(chosen_starts) > 1 and has_vaapi():
+            # Single invocation: one VAAPI init, one pass over the input,
+            # all clips written as separate outputs.
+            cmd = _vaapi_multi_cmd(video_path, chosen_starts, duration, filepaths, probe)
+            try:
+                subprocess.run(cmd, check=True, capture_output=True, bufsize=1 << 20)
+                encoder_used = "vaapi"
+            except subprocess.CalledProcessError:
+                sys.stderr.write(
+                    "[encode] multi-output VAAPI failed, retrying clips individually\n"
+                )
+                sys.stderr.flush()
+                for filepath in filepaths:
+                    if os.path.exists(filepath):
+                        os.remove(filepath)
+
+        if encoder_used == "unknown":
+            encoder_used = _cut_clips_parallel(
+                video_path, chosen_starts, duration, filepaths, probe, aligned,
+            )
+
     clips_meta = []
-    for i, start_time in enumerate(chosen_starts):
-        filename = f"bg_{start_index + i:03d}.mp4"
-        filepath = os.path.join(output_dir, filename)
-        encoder_used = cut_with_ffmpeg(video_path, start_time, duration, filepath)
+    for start_time, filename, filepath in zip(chosen_starts, filenames, filepaths):
         clips_meta.append({
             "filename": filename,
             "clip_path": filepath,
@@ -257,7 +579,7 @@ def main():
     parser.add_argument("--videos-dir", default=os.path.join(os.path.dirname(__file__), "..", "videos"),
                         help="Path to videos directory")
     parser.add_argument("--download-dir", default=None,
-                        help="Directory for downloads (default: YT_DOWNLOAD_DIR or yt_download_raw)")
+                        help="Unused; kept for caller compatibility (downloads go to videos/_sources)")
     args = parser.parse_args()
 
     if not args.url and not args.input:
@@ -265,7 +587,6 @@ def main():
         sys.exit(1)
 
     progress = {"step": "", "error": ""}
-    download_dir = None
     video_path = None
     title = None
     youtube_id = None
@@ -283,35 +604,21 @@ def main():
             progress["step"] = f"Reprocessing existing video ({total_duration:.0f}s)..."
             print(json.dumps(progress), flush=True)
         else:
-            # Download mode
-            base_dir = args.download_dir or os.environ.get("YT_DOWNLOAD_DIR")
-            if not base_dir or not os.path.isdir(base_dir):
-                progress["error"] = f"Download directory required (--download-dir or YT_DOWNLOAD_DIR); got: {base_dir}"
-                print(json.dumps(progress), flush=True)
-                sys.exit(1)
-
-            download_dir = os.path.join(base_dir, f"yt_{int(time.time())}_{uuid.uuid4().hex[:8]}")
-            os.makedirs(download_dir, exist_ok=True)
+            # Download mode: write straight into the permanent _sources
+            # location, skipping the temp-dir download + 5GB move/copy.
+            source_dir = os.path.join(args.videos_dir, "_sources", args.category)
+            os.makedirs(source_dir, exist_ok=True)
 
             progress["step"] = "Downloading video from YouTube..."
             print(json.dumps(progress), flush=True)
 
-            dl_result = download_video(args.url, download_dir)
+            dl_result = download_video(args.url, source_dir)
             video_path = dl_result["path"]
             title = dl_result["title"]
             youtube_id = dl_result["youtube_id"]
+            source_path = video_path
 
-            total_duration = get_duration(video_path)
-
-            # Move source to a permanent location
-            source_dir = os.path.join(args.videos_dir, "_sources", args.category)
-            os.makedirs(source_dir, exist_ok=True)
-            ts = int(time.time())
-            ext = os.path.splitext(video_path)[1]
-            source_filename = f"{youtube_id or 'video'}_{ts}{ext}"
-            source_path = os.path.join(source_dir, source_filename)
-            shutil.move(video_path, source_path)
-            video_path = source_path
+            total_duration = dl_result.get("duration") or get_duration(video_path)
 
             sys.stderr.write(f"[yt-dlp] Source saved to: {source_path}\n")
             sys.stderr.flush()
@@ -325,6 +632,7 @@ def main():
             args.duration,
             args.clips,
             args.videos_dir,
+            total_duration=total_duration,
         )
 
         result = {
@@ -343,10 +651,6 @@ def main():
         progress["error"] = str(e)
         print(json.dumps(progress), flush=True)
         sys.exit(1)
-    finally:
-        # Clean up only the temp download dir (not the moved source)
-        if download_dir and os.path.isdir(download_dir):
-            shutil.rmtree(download_dir, ignore_errors=True)
 
 
 if __name__ == "__main__":